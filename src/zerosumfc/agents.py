@@ -13,6 +13,11 @@ class Agent(ABC):
     which selects a move based on the visible state of the game.
     """
 
+    #: Whether the game should report opponent moves to this agent.
+    #: Agents whose `opponent_move` is a no-op can set this to False so
+    #: the game skips the call entirely.
+    observes_opponent: bool = True
+
     def __init__(self, role: Role):
         """Set the role which this agent is acting as."""
         self._role = role
@@ -55,21 +60,25 @@ class Agent(ABC):
 class RandomAgent(Agent):
     """Dumb agent that just picks a move at random."""
 
+    observes_opponent = False
+
+    _ALL_ACTIONS: tuple[Action, ...] = (
+        Shoot(Role.DEALER),
+        Shoot(Role.PLAYER),
+        *(Use(item) for item in Item),
+    )
+
     def reset_shells(self, live: int, blank: int):
         """Ignored."""
         pass
 
     def get_move(self, state: GameState) -> Action:
         """Pick a move at random based on what is currently possible."""
-        actions: list[Action] = [
-            Shoot(Role.DEALER),
-            Shoot(Role.PLAYER),
+        my_state = state[self.role]
+        weights = [1, 1] + [
+            1 if my_state[item] > 0 else 0 for item in Item
         ]
-
-        for item, count in state[self.role].items():
-            if count > 0:
-                actions.append(Use(item))
-        return random.choice(actions)
+        return random.choices(self._ALL_ACTIONS, weights=weights)[0]
 
     def receive_feedback(self, feedback: Shell | None):
         """Ignored."""
@@ -82,6 +91,8 @@ class RandomAgent(Agent):
 class BlasterAgent(Agent):
     """This agent always chooses to shoot its opponent"""
 
+    observes_opponent = False
+
     def reset_shells(self, live: int, blank: int):
         """Ignored."""
         pass
@@ -1,6 +1,8 @@
 from datetime import datetime
 import logging
+import multiprocessing
 import pathlib
+import random
 import click
 
 from zerosumfc.buckshotroulette import Game
@@ -16,12 +18,38 @@ def print_and_log(msg: str):
     print(msg)
 
 
+def _run_one(args) -> Role:
+    """Build fresh agents and run a single game (used by worker pools).
+
+    Each game gets its own seeded rng; without this, forked workers can
+    inherit identical generator state and replay the same games.
+    """
+    player_agent, dealer_agent, health, seed = args
+    player = make_agent(player_agent, Role.PLAYER)
+    dealer = make_agent(dealer_agent, Role.DEALER)
+    game = Game(
+        dealer=dealer,
+        player=player,
+        initial_health=health,
+        rng=random.Random(seed),
+    )
+    return game.run()
+
+
 @click.command()
 @click.argument("player_agent", type=AgentChoice)
 @click.argument("dealer_agent", type=AgentChoice)
 @click.option("--rounds", type=int, default=10)
 @click.option("--health", type=int, default=5)
-def main(player_agent, dealer_agent, rounds, health):
+@click.option(
+    "--jobs",
+    type=int,
+    default=1,
+    help="Number of games to run in parallel. The games are independent, "
+    "so this scales with CPU cores, but per-move logs are only written "
+    "when running serially.",
+)
+def main(player_agent, dealer_agent, rounds, health, jobs):
     player_name = player_agent.name
     dealer_name = dealer_agent.name
 
@@ -40,17 +68,30 @@ def main(player_agent, dealer_agent, rounds, health):
         f"Evaluating player: {player_agent} vs dealer: {dealer_agent}"
     )
     logger.info(f"{rounds} rounds with initial health {health}")
-    player = make_agent(player_agent, Role.PLAYER)
-    dealer = make_agent(dealer_agent, Role.DEALER)
-
     player_wins = 0
     dealer_wins = 0
 
-    for i in range(rounds):
-        game = Game(dealer=dealer, player=player, initial_health=health)
-        print_and_log(f"Running game {i}")
-        winner = game.run()
-        print_and_log(f"Winner is {winner}")
+    if jobs == 1:
+        player = make_agent(player_agent, Role.PLAYER)
+        dealer = make_agent(dealer_agent, Role.DEALER)
+        winners = []
+        for i in range(rounds):
+            game = Game(dealer=dealer, player=player, initial_health=health)
+            print_and_log(f"Running game {i}")
+            winners.append(game.run())
+            print_and_log(f"Winner is {winners[-1]}")
+    else:
+        work = [
+            (player_agent, dealer_agent, health, random.getrandbits(64))
+            for _ in range(rounds)
+        ]
+        with multiprocessing.Pool(jobs) as pool:
+            winners = []
+            for winner in pool.imap_unordered(_run_one, work):
+                print_and_log(f"Winner is {winner}")
+                winners.append(winner)
+
+    for winner in winners:
         match winner:
             case Role.PLAYER:
                 player_wins += 1
@@ -1,35 +1,56 @@
 """Simulates a game of Buckshot Roulette."""
 
+import itertools
 import logging
 import random
 import click
-from copy import copy
 from dataclasses import dataclass, replace
+from functools import cache
+from typing import ClassVar
 
 from zerosumfc.agents import Agent
 from zerosumfc.cliutils import AgentChoice, AgentType, make_agent
 from zerosumfc.data import (
+    HIT,
+    MISS,
+    SEE,
+    USED,
     Action,
     Feedback,
     GameState,
     Heal,
-    Hit,
     Item,
-    Miss,
     Role,
-    See,
     Shell,
     Shoot,
     Use,
-    Used,
 )
 from zerosumfc.minmaxagent import MinMaxAgent
 from zerosumfc.textagent import TextAgent
 
 logger = logging.getLogger(__name__)
 
+# Hoisted so hot paths do not rebuild enum member lists.
+_ITEMS = tuple(Item)
+_ROLES = tuple(Role)
 
-@dataclass(frozen=True)
+# Fallback generator for callers that do not supply their own.
+_DEFAULT_RNG = random.Random()
+
+
+@cache
+def _decks(live: int, blank: int) -> tuple[tuple[Shell, ...], ...]:
+    """Every distinct ordering of the given live and blank shell counts.
+
+    With at most a handful of shells there are only a few dozen
+    arrangements per (live, blank) pair, so they are built once and a
+    reload just picks one instead of shuffling a fresh list.
+    """
+    shells = [Shell.LIVE] * live + [Shell.BLANK] * blank
+    return tuple(set(itertools.permutations(shells)))
+
+
+@dataclass(frozen=True, slots=True)
 class FullGameState:
     visible_state: GameState
     shells: list[Shell]
@@ -43,97 +64,133 @@ class FullGameState:
         current_player = self.visible_state.current_player
         logger.info("%s tries to use %s", current_player, item)
         taken, visible_state = self.visible_state.take_item(item)
-        state = replace(self, visible_state=visible_state)
-        if taken:
-            match item:
-                case Item.GLASS:
-                    shell = self.peek_shell()
-                    if shell is not None:
-                        logger.info("%s seen", shell)
-                        return See(shell), state
-                case Item.BEER:
-                    shell, state = state.pop_shell()
-                    if shell is not None:
-                        logger.info("%s seen", shell)
-                        return See(shell), state
-                case Item.CIGARETTES:
-                    return Heal(1), replace(
-                        state, visible_state=visible_state.heal_current_player(1)
-                    )
-                case Item.SAW:
-                    return Used(item), _replace_visible(state, saw_active=True)
-
-                case Item.HANDCUFFS:
-                    return Used(item), _replace_visible(state,
-                            handcuffs_active=True
-                    )
-        else:
+        state = FullGameState(visible_state, self.shells)
+        if not taken:
             logger.info("No %s in %s inventory", item, current_player)
+            return None, state
+        return self._ITEM_HANDLERS[item](state)
+
+    def _use_glass(self) -> tuple[Feedback | None, "FullGameState"]:
+        shell = self.peek_shell()
+        if shell is not None:
+            logger.info("%s seen", shell)
+            return SEE[shell], self
+        return None, self
+
+    def _use_beer(self) -> tuple[Feedback | None, "FullGameState"]:
+        shell, state = self.pop_shell()
+        if shell is not None:
+            logger.info("%s seen", shell)
+            return SEE[shell], state
         return None, state
 
+    def _use_cigarettes(self) -> tuple[Feedback, "FullGameState"]:
+        return Heal(1), FullGameState(
+            self.visible_state.heal_current_player(1), self.shells
+        )
+
+    def _use_saw(self) -> tuple[Feedback, "FullGameState"]:
+        return USED[Item.SAW], _replace_visible(self, saw_active=True)
+
+    def _use_handcuffs(self) -> tuple[Feedback, "FullGameState"]:
+        return USED[Item.HANDCUFFS], _replace_visible(
+            self, handcuffs_active=True
+        )
+
+    # One dict lookup instead of a chain of match arms on every use.
+    _ITEM_HANDLERS: ClassVar[dict] = {
+        Item.GLASS: _use_glass,
+        Item.BEER: _use_beer,
+        Item.CIGARETTES: _use_cigarettes,
+        Item.SAW: _use_saw,
+        Item.HANDCUFFS: _use_handcuffs,
+    }
+
     def shoot(
         self, target: Role
     ) -> tuple[Feedback, "FullGameState"]:
         logger.info("%s shoots %s", self.visible_state.current_player, target)
         shell, state = self.pop_shell()
-        state = replace(state, visible_state=self.visible_state.shoot(shell, target))
+        state = FullGameState(
+            self.visible_state.shoot(shell, target), state.shells
+        )
         if shell == Shell.LIVE:
             logger.info("It's a hit!")
-            return Hit(target), state
+            return HIT[target], state
         else:
             logger.info("It was a blank shell.")
-            return Miss(), state
+            return MISS, state
 
 
-    def reload(self, max_shells=4) -> tuple[tuple[int, int], "FullGameState"]:
-        live = random.randint(1, max_shells)
-        blank = random.randint(1, max_shells)
+    def reload(
+        self, max_shells=4, rng: random.Random | None = None
+    ) -> tuple[tuple[int, int], "FullGameState"]:
+        if rng is None:
+            rng = _DEFAULT_RNG
+        live = rng.randint(1, max_shells)
+        blank = rng.randint(1, max_shells)
         logger.info("Reloading with %d live shells and %d blanks", live, blank)
-        shells = [Shell.LIVE] * live + [Shell.BLANK] * blank
-        random.shuffle(shells)
-        state = replace(self, shells=shells)
+        shells = list(rng.choice(_decks(live, blank)))
+        state = FullGameState(self.visible_state, shells)
         #state = _replace_visible(state, current_player=Role.PLAYER)
         return (live, blank), state
 
-    def restock(self, num_items=3) -> "FullGameState":
+    def restock(
+        self, num_items=3, rng: random.Random | None = None
+    ) -> "FullGameState":
+        if rng is None:
+            rng = _DEFAULT_RNG
         items = []
-        for _ in list(Role):
-            items.append(random.choices(list(Item), k=3))
+        for _ in _ROLES:
+            items.append(rng.choices(_ITEMS, k=3))
         visible_state = self.visible_state.add_all(*items)
-        return replace(self, visible_state=visible_state)
+        return FullGameState(visible_state, self.shells)
 
 
     def peek_shell(self) -> Shell:
         return self.shells[-1]
 
     def pop_shell(self) -> tuple[Shell, "FullGameState"]:
-        shells = copy(self.shells)
-        shell = shells.pop()
-        return shell, replace(self, shells=shells)
+        shell = self.shells[-1]
+        return shell, FullGameState(self.visible_state, self.shells[:-1])
 
 
 def _replace_visible(state, **kwargs):
     visible_state = replace(state.visible_state, **kwargs)
-    return replace(state, visible_state=visible_state)
+    return FullGameState(visible_state, state.shells)
 
 
 class Game:
     """Keeps track of a game of Buckshot Roulette played between two agents."""
 
-    def __init__(self, dealer: Agent, player: Agent, initial_health: int):
-        """Initailise a game with two agents and set their initial health."""
-        self._agents = {Role.DEALER: dealer, Role.PLAYER: player}
+    __slots__ = ("_agents", "_state", "_rng")
+
+    def __init__(
+        self,
+        dealer: Agent,
+        player: Agent,
+        initial_health: int,
+        rng: random.Random | None = None,
+    ):
+        """Initailise a game with two agents and set their initial health.
+
+        An rng can be supplied to make the game reproducible; by default
+        each game gets its own generator rather than sharing the module
+        level one.
+        """
+        # Indexed by role ordinal (Role is an IntEnum starting at 1).
+        self._agents = (player, dealer)
         self._state = FullGameState.new(initial_health)
+        self._rng = rng if rng is not None else random.Random()
 
     def _perform_action(self, action: Action) -> Feedback | None:
-        match action:
-            case Shoot(target):
-                result, self._state = self._state.shoot(target)
-                return result
-
-            case Use(item):
-                result, self._state = self._state.use_item(item)
-                return result
+        if isinstance(action, Shoot):
+            result, self._state = self._state.shoot(action.target)
+        elif isinstance(action, Use):
+            result, self._state = self._state.use_item(action.item)
+        else:
+            raise ValueError(f"action cannot be {action}")
+        return result
 
     def run(self) -> Role:
         """Start the game and continue until we have a winner."""
@@ -142,33 +199,38 @@ class Game:
             if not self._state.shells:
                 self._reload()
                 self._restock()
-            current_player = self._state.visible_state.current_player
-            shooter = self._agents[current_player]
-            opponent = self._agents[current_player.opponent]
+            visible_state = self._state.visible_state
+            current_player = visible_state.current_player
+            shooter = self._agents[current_player - 1]
+            opponent = self._agents[current_player.opponent - 1]
             logger.info(self._state)
             logger.info("Waiting on %s", current_player)
-            action = shooter.get_move(self._state.visible_state)
+            action = shooter.get_move(visible_state)
             logger.info("%s chooses to %s", current_player, action)
             feedback = self._perform_action(action)
             logger.info("Result: %s", feedback)
             shooter.receive_feedback(feedback)
-            opponent_feedback = feedback if action != Use(Item.GLASS) else None
-            opponent.opponent_move(action, opponent_feedback)
+            if opponent.observes_opponent:
+                opponent_feedback = (
+                    feedback if action != Use(Item.GLASS) else None
+                )
+                opponent.opponent_move(action, opponent_feedback)
         return self._winner
 
     def _reload(self):
-        counts, self._state = self._state.reload()
-        for agent in self._agents.values():
+        counts, self._state = self._state.reload(rng=self._rng)
+        for agent in self._agents:
             agent.reset_shells(*counts)
 
     def _restock(self):
-        self._state = self._state.restock(0)
+        self._state = self._state.restock(0, rng=self._rng)
 
     @property
     def _winner(self) -> Role | None:
-        if self._state.visible_state.dealer_state.health == 0:
+        visible_state = self._state.visible_state
+        if visible_state.dealer_state.health == 0:
             return Role.PLAYER
-        if self._state.visible_state.player_state.health == 0:
+        if visible_state.player_state.health == 0:
             return Role.DEALER
 
 
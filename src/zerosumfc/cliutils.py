@@ -10,6 +10,7 @@ from zerosumfc.gptagent import GptAgent
 from zerosumfc.minmaxagent import MinMaxAgent
 
 dotenv.load_dotenv()
+_API_KEY = os.getenv("OPENAI_KEY")
 
 
 class AgentType(enum.Enum):
@@ -29,20 +30,25 @@ def getLoggingLevel(default_level: int) -> int:
     return logging.getLevelNamesMapping()[env_level]
 
 
+def _make_gpt(role: Role) -> GptAgent:
+    if _API_KEY is None:
+        raise ValueError(
+            "Canot find OpenAI API key. "
+            "Please set the OPENAI_KEY environment variable."
+        )
+    return GptAgent(_API_KEY, role)
+
+
+_AGENT_CTORS = {
+    AgentType.RANDOM: RandomAgent,
+    AgentType.MINMAX: MinMaxAgent,
+    AgentType.BLASTER: BlasterAgent,
+    AgentType.GPT: _make_gpt,
+}
+
+
 def make_agent(agent_type: AgentType, role: Role):
-    match agent_type:
-        case AgentType.RANDOM:
-            return RandomAgent(role)
-        case AgentType.MINMAX:
-            return MinMaxAgent(role)
-        case AgentType.BLASTER:
-            return BlasterAgent(role)
-        case AgentType.GPT:
-            key_env_var = "OPENAI_KEY"
-            api_key = os.getenv(key_env_var)
-            if api_key is None:
-                raise ValueError(
-                    "Canot find OpenAI API key. "
-                    f"Please set {key_env_var} the environment variable."
-                )
-            return GptAgent(api_key, role)
+    try:
+        return _AGENT_CTORS[agent_type](role)
+    except KeyError:
+        raise ValueError(f"Unknown agent type: {agent_type}") from None
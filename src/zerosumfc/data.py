@@ -1,31 +1,45 @@
 """Data classes used by the game and the agents to communicate."""
 
 from abc import ABC
-from copy import copy
 from collections.abc import Sequence
 from dataclasses import dataclass, replace
-from enum import Enum, auto, unique
-from types import MappingProxyType
+from enum import Enum, IntEnum, auto, unique
 from typing import ClassVar
 
 
+class _NamedIntEnum(IntEnum):
+    """An IntEnum that still renders with the member's name.
+
+    IntEnum's str()/format() produce the bare integer on recent
+    Pythons; keep the Enum rendering so logs and CLI output still name
+    the member. Costs nothing on the comparison paths.
+    """
+
+    __str__ = Enum.__str__
+
+    def __format__(self, format_spec: str) -> str:
+        return Enum.__format__(self, format_spec)
+
+
 @unique
-class Role(Enum):
+class Role(_NamedIntEnum):
     """Which role are we talking about from the game's perspective."""
 
     PLAYER = auto()
     DEALER = auto()
 
     @property
-    def opponent(self):
+    def opponent(self) -> "Role":
         """The actor's opponent's role."""
-        if self == Role.PLAYER:
-            return Role.DEALER
-        return Role.PLAYER
+        return _OPPONENT[self - 1]
+
+
+# Indexed by role ordinal (Role is an IntEnum starting at 1).
+_OPPONENT = (Role.DEALER, Role.PLAYER)
 
 
 @unique
-class Item(Enum):
+class Item(_NamedIntEnum):
     """Items which can be used to gain stats boosts."""
 
     GLASS = auto()
@@ -35,8 +49,11 @@ class Item(Enum):
     HANDCUFFS = auto()
 
 
+_ITEMS = tuple(Item)
+
+
 @unique
-class Shell(Enum):
+class Shell(_NamedIntEnum):
     """Shells can be live or blank."""
 
     LIVE = auto()
@@ -49,24 +66,24 @@ class Action(ABC):
     Can be either shooting or using an item
     """
 
-    pass
+    __slots__ = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Shoot(Action):
     """Indicates who the agent wants to shoot."""
 
     target: Role
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Use(Action):
     """Which item does the agent want to use."""
 
     item: Item
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlayerState:
     """The player's health and item counts.
 
@@ -119,11 +136,26 @@ class PlayerState:
                 return replace(self, saw_count=self.saw_count + 1)
 
     def add_all(self, items: Sequence[Item]) -> "PlayerState":
-        """Add multiple items to the inventory."""
-        state = copy(self)
+        """Add multiple items to the inventory in one replacement.
+
+        Building the new counts up front means a three-item restock
+        allocates one state instead of one per item.
+        """
+        counts = {item: self[item] for item in Item}
+        total = sum(counts.values())
         for item in items:
-            state = state.add_item(item)
-        return state
+            if total >= self.MAX_ITEMS:
+                break
+            counts[item] += 1
+            total += 1
+        return replace(
+            self,
+            glass_count=counts[Item.GLASS],
+            beer_count=counts[Item.BEER],
+            saw_count=counts[Item.SAW],
+            handcuffs_count=counts[Item.HANDCUFFS],
+            cigarettes_count=counts[Item.CIGARETTES],
+        )
 
     def take_item(self, item: Item) -> tuple[bool, "PlayerState"]:
         """If the item count is greater than 0, use up the item."""
@@ -162,19 +194,25 @@ class PlayerState:
                 return self.saw_count
 
     def items(self):
-        for item in list(Item):
+        for item in _ITEMS:
             yield item, self[item]
 
     @property
     def total_items(self) -> int:
-        return sum(self[item] for item in list(Item))
+        return (
+            self.glass_count
+            + self.beer_count
+            + self.saw_count
+            + self.handcuffs_count
+            + self.cigarettes_count
+        )
 
     def __contains__(self, item: Item) -> bool:
         """Return true if the player have the item in their inventory."""
         return self[item] > 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameState:
     """The information that is provided to an agent before they make a move.
 
@@ -191,17 +229,22 @@ class GameState:
     handcuffs_active: bool = False
 
     def __post_init__(self):
-        for health in (self.player_state.health, self.dealer_state.health):
-            if health > self.max_health:
-                raise ValueError(
-                    f"health ({health}) exceeds maximum ({self.max_health}"
-                )
+        # Kept deliberately cheap: this runs on every replace()-derived
+        # state, and the internal transitions already clamp health.
+        max_health = self.max_health
+        if (
+            self.player_state.health > max_health
+            or self.dealer_state.health > max_health
+        ):
+            health = max(
+                self.player_state.health, self.dealer_state.health
+            )
+            raise ValueError(
+                f"health ({health}) exceeds maximum ({max_health}"
+            )
 
     def __getitem__(self, role: Role) -> PlayerState:  # noqa: D105
-        if role == Role.DEALER:
-            return self.dealer_state
-        if role == Role.PLAYER:
-            return self.player_state
+        return (self.player_state, self.dealer_state)[role - 1]
 
     @classmethod
     def new(cls, max_health: int) -> "GameState":
@@ -215,10 +258,16 @@ class GameState:
         return replace(self, handcuffs_active=False, saw_active=False)
 
     def end_turn(self) -> "GameState":
-        if self.handcuffs_active:
-            return self.reset_modifiers()
+        next_player = (
+            self.current_player
+            if self.handcuffs_active
+            else self.current_player.opponent
+        )
         return replace(
-            self.reset_modifiers(), current_player=self.current_player.opponent
+            self,
+            handcuffs_active=False,
+            saw_active=False,
+            current_player=next_player,
         )
 
     def shoot(self, shell: Shell, target: Role) -> "GameState":
@@ -268,22 +317,22 @@ class GameState:
 class Feedback(ABC):
     """Any information that could be sent to the agent after they move."""
 
-    pass
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Hit(Feedback):
     """Tell the agent they scored a hit."""
 
     target: Role
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Miss(Feedback):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class See(Feedback):
     """Tell the agent what color shell they have just seen.
 
@@ -294,11 +343,19 @@ class See(Feedback):
     shell: Shell
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Heal(Feedback):
     amount: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Used(Feedback):
     item: Item
+
+
+# Feedback values come from tiny domains, so the game hands out these
+# shared instances instead of allocating one per move.
+MISS = Miss()
+HIT = {role: Hit(role) for role in Role}
+SEE = {shell: See(shell) for shell in Shell}
+USED = {item: Used(item) for item in Item}
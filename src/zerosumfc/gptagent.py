@@ -87,6 +87,19 @@ class GptResponse(pydantic.BaseModel):
     action: GptAction
 
 
+# One lookup instead of a seven-way match; the callables take the
+# agent's role so the shoot actions can resolve relative targets.
+_TRANSLATE = {
+    GptAction.SHOOT_SELF: lambda role: Shoot(role),
+    GptAction.SHOOT_OPPONENT: lambda role: Shoot(role.opponent),
+    GptAction.USE_GLASS: lambda role: Use(Item.GLASS),
+    GptAction.USE_CIGARETTES: lambda role: Use(Item.CIGARETTES),
+    GptAction.USE_BEER: lambda role: Use(Item.BEER),
+    GptAction.USE_HANDSAW: lambda role: Use(Item.SAW),
+    GptAction.USE_HANDCUFFS: lambda role: Use(Item.HANDCUFFS),
+}
+
+
 class GptAgent(Agent):
     COMMAND = "What do you want to do?"
     GPT_VERSION = "gpt-5"
@@ -157,18 +170,4 @@ class GptAgent(Agent):
         return response
 
     def _translate_action(self, response: GptResponse) -> Action:
-        match response.action:
-            case GptAction.SHOOT_SELF:
-                return Shoot(self.role)
-            case GptAction.SHOOT_OPPONENT:
-                return Shoot(self.role.opponent)
-            case GptAction.USE_BEER:
-                return Use(Item.BEER)
-            case GptAction.USE_CIGARETTES:
-                return Use(Item.CIGARETTES)
-            case GptAction.USE_GLASS:
-                return Use(Item.GLASS)
-            case GptAction.USE_HANDCUFFS:
-                return Use(Item.HANDCUFFS)
-            case GptAction.USE_HANDSAW:
-                return Use(Item.SAW)
+        return _TRANSLATE[response.action](self.role)
@@ -1,7 +1,10 @@
 from dataclasses import dataclass, field, replace
 from functools import cache
 import logging
+import math
 import random
+import time
+from typing import ClassVar
 
 from zerosumfc.agents import Agent
 from zerosumfc.data import (
@@ -11,6 +14,7 @@ from zerosumfc.data import (
     Hit,
     Item,
     Miss,
+    PlayerState,
     Role,
     See,
     Shell,
@@ -21,8 +25,18 @@ from zerosumfc.data import (
 
 logger = logging.getLogger(__name__)
 
+# Hoisted so the search never rebuilds enum member lists per node.
+_ROLES = tuple(Role)
+_SHELLS = tuple(Shell)
+_ITEM_MEMBERS = tuple(Item)
 
-@dataclass(frozen=True)
+# Actions are value-only, so the search reuses these singletons rather
+# than allocating fresh ones at every expanded node.
+_SHOOT = {role: Shoot(role) for role in Role}
+_USE = {item: Use(item) for item in Item}
+
+
+@dataclass(frozen=True, slots=True)
 class StateProb:
     p_state: float
     state: "MinMaxState"
@@ -31,7 +45,7 @@ class StateProb:
 StateList = list[StateProb]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HiddenState:
     live_shells: int
     blank_shells: int
@@ -73,11 +87,28 @@ class HiddenState:
         return count / total
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MinMaxState:
     visible_state: GameState
     hidden_state: HiddenState
 
+    def _shell_outcomes(self, make_state) -> StateList:
+        """Weight `make_state` over the shells that could come up next.
+
+        Shared by every chance move; the two shell colours are unrolled
+        so no per-call list of shells or repeated count/prob dispatch is
+        needed.
+        """
+        live = self.hidden_state.live_shells
+        blank = self.hidden_state.blank_shells
+        total = live + blank
+        states = []
+        if live:
+            states.append(StateProb(live / total, make_state(Shell.LIVE)))
+        if blank:
+            states.append(StateProb(blank / total, make_state(Shell.BLANK)))
+        return states
+
     def shoot(self, target: Role) -> StateList:
         def make_state(shell):
             return MinMaxState(
@@ -85,15 +116,7 @@ class MinMaxState:
                 hidden_state=self.hidden_state.use(shell),
             )
 
-        states = []
-
-        for shell in list(Shell):
-            if self.hidden_state.count(shell) > 0:
-                p_shell = self.hidden_state.prob(shell)
-                state = make_state(shell)
-                states.append(StateProb(p_shell, state))
-
-        return states
+        return self._shell_outcomes(make_state)
 
     def use_beer(self) -> StateList:
         new_visible_state = self._try_take(Item.BEER)
@@ -106,15 +129,7 @@ class MinMaxState:
                 hidden_state=new_hidden_state,
             )
 
-        states = []
-
-        for shell in list(Shell):
-            if self.hidden_state.count(shell) > 0:
-                p_shell = self.hidden_state.prob(shell)
-                state = make_state(shell)
-                states.append(StateProb(p_shell, state))
-
-        return states
+        return self._shell_outcomes(make_state)
 
     def use_cigarettes(self) -> StateList:
         new_visible_state = self._try_take(
@@ -137,44 +152,34 @@ class MinMaxState:
                 hidden_state=replace(self.hidden_state, next_shell=shell),
             )
 
-        states = []
-
-        for shell in list(Shell):
-            if self.hidden_state.count(shell) > 0:
-                p_shell = self.hidden_state.prob(shell)
-                state = make_state(shell)
-                states.append(StateProb(p_shell, state))
-
-        return states
+        return self._shell_outcomes(make_state)
 
     def use_saw(self) -> StateList:
         new_visible_state = self._try_take(Item.SAW)
         new_visible_state = replace(new_visible_state, saw_active=True)
         return [StateProb(1.0, replace(self, visible_state=new_visible_state))]
 
+    # One dict lookup instead of a chain of match arms on every use.
+    _ITEM_HANDLERS: ClassVar[dict] = {
+        Item.BEER: use_beer,
+        Item.CIGARETTES: use_cigarettes,
+        Item.HANDCUFFS: use_handcuffs,
+        Item.GLASS: use_glass,
+        Item.SAW: use_saw,
+    }
+
     def use_item(self, item: Item) -> StateList:
-        match item:
-            case Item.BEER:
-                return self.use_beer()
-            case Item.CIGARETTES:
-                return self.use_cigarettes()
-            case Item.HANDCUFFS:
-                return self.use_handcuffs()
-            case Item.GLASS:
-                return self.use_glass()
-            case Item.SAW:
-                return self.use_saw()
-            case _:
-                raise ValueError(f"item must not be {item}")
+        handler = self._ITEM_HANDLERS.get(item)
+        if handler is None:
+            raise ValueError(f"item must not be {item}")
+        return handler(self)
 
     def perform_action(self, action: Action) -> StateList:
-        match action:
-            case Shoot(target):
-                return self.shoot(target)
-            case Use(item):
-                return self.use_item(item)
-            case _:
-                raise ValueError(f"action cannot be {action}")
+        if isinstance(action, Shoot):
+            return self.shoot(action.target)
+        if isinstance(action, Use):
+            return self.use_item(action.item)
+        raise ValueError(f"action cannot be {action}")
 
     def _try_take(self, item: Item) -> GameState:
         success, state = self.visible_state.take_item(item)
@@ -182,114 +187,651 @@ class MinMaxState:
             raise ValueError("Agent tried to use unavailable item")
         return state
 
+    def to_mutable(self) -> "SearchState":
+        """Convert to the mutable representation used by the search."""
+        return SearchState.from_minmax(self)
+
+
+_ZOBRIST: dict[tuple, int] = {}
+
+
+def _zobrist(*component) -> int:
+    """Return a random 64-bit constant for one (component, value) pair.
+
+    Constants are drawn lazily the first time a component is seen, so the
+    table never needs to be sized up front for a given max_health.
+    """
+    value = _ZOBRIST.get(component)
+    if value is None:
+        value = random.getrandbits(64)
+        _ZOBRIST[component] = value
+    return value
+
+
+# Bitfield layout for SearchState.packed: 6 bits of health per role,
+# 4 bits per (role, item) count, 4 bits per shell colour count, one bit
+# per flag and 2 bits for the known next shell.
+_HEALTH_BITS = 6
+_HEALTH_MASK = (1 << _HEALTH_BITS) - 1
+_ITEM_BITS = 4
+_ITEM_MASK = (1 << _ITEM_BITS) - 1
+_ITEMS_SHIFT = _HEALTH_BITS * len(Role)
+_LIVE_SHIFT = _ITEMS_SHIFT + _ITEM_BITS * len(Item) * len(Role)
+_BLANK_SHIFT = _LIVE_SHIFT + 4
+_SHELL_MASK = 0xF
+_SAW_BIT = 1 << (_BLANK_SHIFT + 4)
+_HANDCUFFS_BIT = _SAW_BIT << 1
+_DEALER_BIT = _SAW_BIT << 2
+_NEXT_SHIFT = _BLANK_SHIFT + 7
+_NEXT_CODE = {None: 0, Shell.LIVE: 1, Shell.BLANK: 2}
+_NEXT_SHELL = (None, Shell.LIVE, Shell.BLANK)
+
+
+def _health_shift(role: Role) -> int:
+    return _HEALTH_BITS * (role.value - 1)
+
+
+def _item_shift(role: Role, item: Item) -> int:
+    slot = (role.value - 1) * len(Item) + item.value - 1
+    return _ITEMS_SHIFT + _ITEM_BITS * slot
+
+
+class SearchState:
+    """A mutable view of a MinMaxState used inside the search recursion.
+
+    Expanding a node by building fresh MinMaxState instances copies the item
+    counts and shell counts at every ply. Instead the recursion converts the
+    root state once and then makes and unmakes moves in place with
+    `apply`/`undo`.
+
+    Every counter and flag lives in a single int (`packed`) laid out as
+    fixed-width bitfields, so reading or updating a field is a shift and
+    a mask instead of a chain of dict lookups, and undoing a move is just
+    restoring one int. The state also maintains a 64-bit Zobrist hash of
+    itself incrementally as moves are made and unmade, which the
+    transposition table uses as its key.
+    """
+
+    __slots__ = ("packed", "max_health", "hash")
+
+    def __init__(
+        self,
+        health: dict[Role, int],
+        items: dict[Role, dict[Item, int]],
+        max_health: int,
+        current_player: Role,
+        saw_active: bool,
+        handcuffs_active: bool,
+        live_shells: int,
+        blank_shells: int,
+        next_shell: Shell | None,
+    ):
+        """Pack the given fields into a fresh state and hash it."""
+        # GameState guarantees health <= max_health, so checking the
+        # cap guards every value written into the 6-bit health fields;
+        # overflow would silently bleed into the neighbouring field.
+        if max_health > _HEALTH_MASK:
+            raise ValueError(
+                f"max health {max_health} does not fit in the packed "
+                f"search state (limit {_HEALTH_MASK})"
+            )
+        packed = 0
+        for role in _ROLES:
+            packed |= health[role] << _health_shift(role)
+            for item in _ITEM_MEMBERS:
+                packed |= items[role][item] << _item_shift(role, item)
+        packed |= live_shells << _LIVE_SHIFT
+        packed |= blank_shells << _BLANK_SHIFT
+        if saw_active:
+            packed |= _SAW_BIT
+        if handcuffs_active:
+            packed |= _HANDCUFFS_BIT
+        if current_player == Role.DEALER:
+            packed |= _DEALER_BIT
+        packed |= _NEXT_CODE[next_shell] << _NEXT_SHIFT
+        self.packed = packed
+        self.max_health = max_health
+        self.hash = self._full_hash()
+
+    def health(self, role: Role) -> int:
+        """Return the given role's current health."""
+        return (self.packed >> _health_shift(role)) & _HEALTH_MASK
+
+    def item_count(self, role: Role, item: Item) -> int:
+        """How many of the item the given role is holding."""
+        return (self.packed >> _item_shift(role, item)) & _ITEM_MASK
+
+    @property
+    def live_shells(self) -> int:
+        """The number of live shells left in the gun."""
+        return (self.packed >> _LIVE_SHIFT) & _SHELL_MASK
+
+    @property
+    def blank_shells(self) -> int:
+        """The number of blank shells left in the gun."""
+        return (self.packed >> _BLANK_SHIFT) & _SHELL_MASK
+
+    @property
+    def saw_active(self) -> bool:
+        """Whether the saw has been used this turn."""
+        return bool(self.packed & _SAW_BIT)
+
+    @property
+    def handcuffs_active(self) -> bool:
+        """Whether the opponent is currently handcuffed."""
+        return bool(self.packed & _HANDCUFFS_BIT)
+
+    @property
+    def current_player(self) -> Role:
+        """The role whose turn it is to move."""
+        return Role.DEALER if self.packed & _DEALER_BIT else Role.PLAYER
+
+    @property
+    def next_shell(self) -> Shell | None:
+        """The chambered shell if it is known, otherwise None."""
+        return _NEXT_SHELL[(self.packed >> _NEXT_SHIFT) & 0x3]
+
+    def _full_hash(self) -> int:
+        state_hash = _zobrist("max_health", self.max_health)
+        state_hash ^= _zobrist("player", self.current_player)
+        state_hash ^= _zobrist("next", self.next_shell)
+        state_hash ^= _zobrist("shells", Shell.LIVE, self.live_shells)
+        state_hash ^= _zobrist("shells", Shell.BLANK, self.blank_shells)
+        if self.saw_active:
+            state_hash ^= _zobrist("saw")
+        if self.handcuffs_active:
+            state_hash ^= _zobrist("handcuffs")
+        for role in _ROLES:
+            state_hash ^= _zobrist("health", role, self.health(role))
+            for item in _ITEM_MEMBERS:
+                state_hash ^= _zobrist(
+                    "items", role, item, self.item_count(role, item)
+                )
+        return state_hash
+
+    @classmethod
+    def from_minmax(cls, state: "MinMaxState") -> "SearchState":
+        """Build a mutable copy of the given immutable state."""
+        visible = state.visible_state
+        hidden = state.hidden_state
+        return cls(
+            health={role: visible[role].health for role in _ROLES},
+            items={
+                role: {item: visible[role][item] for item in _ITEM_MEMBERS}
+                for role in _ROLES
+            },
+            max_health=visible.max_health,
+            current_player=visible.current_player,
+            saw_active=visible.saw_active,
+            handcuffs_active=visible.handcuffs_active,
+            live_shells=hidden.live_shells,
+            blank_shells=hidden.blank_shells,
+            next_shell=hidden.next_shell,
+        )
+
+    def to_minmax(self) -> "MinMaxState":
+        """Unpack back into the immutable MinMaxState representation."""
+
+        def player_state(role: Role) -> PlayerState:
+            return PlayerState(
+                health=self.health(role),
+                glass_count=self.item_count(role, Item.GLASS),
+                beer_count=self.item_count(role, Item.BEER),
+                saw_count=self.item_count(role, Item.SAW),
+                handcuffs_count=self.item_count(role, Item.HANDCUFFS),
+                cigarettes_count=self.item_count(role, Item.CIGARETTES),
+            )
+
+        visible = GameState(
+            player_state=player_state(Role.PLAYER),
+            dealer_state=player_state(Role.DEALER),
+            max_health=self.max_health,
+            current_player=self.current_player,
+            saw_active=self.saw_active,
+            handcuffs_active=self.handcuffs_active,
+        )
+        hidden = HiddenState(
+            self.live_shells, self.blank_shells, self.next_shell
+        )
+        return MinMaxState(visible_state=visible, hidden_state=hidden)
+
+    def shell_outcomes(self) -> list[tuple[float, Shell]]:
+        """List the possible next shells and their probabilities."""
+        if self.next_shell is not None:
+            return [(1.0, self.next_shell)]
+        total = self.live_shells + self.blank_shells
+        outcomes = []
+        if self.live_shells > 0:
+            outcomes.append((self.live_shells / total, Shell.LIVE))
+        if self.blank_shells > 0:
+            outcomes.append((self.blank_shells / total, Shell.BLANK))
+        return outcomes
+
+    def apply(self, action: Action, shell: Shell | None = None) -> tuple:
+        """Make the move in place and return a token for `undo`.
+
+        For chance moves (shooting, beer, glass) the caller supplies the
+        shell which the chance node resolved to.
+        """
+        token = (self.hash, self.packed)
+        if isinstance(action, Shoot):
+            if shell is None:
+                raise ValueError("shooting requires a resolved shell")
+            self._shoot(action.target, shell)
+        elif isinstance(action, Use):
+            self._use(action.item, shell)
+        else:
+            raise ValueError(f"action cannot be {action}")
+        return token
+
+    def undo(self, token: tuple) -> None:
+        """Restore the state to what it was before the matching `apply`."""
+        self.hash, self.packed = token
+
+    def _set_health(self, role: Role, health: int) -> None:
+        shift = _health_shift(role)
+        self.hash ^= _zobrist("health", role, self.health(role))
+        self.hash ^= _zobrist("health", role, health)
+        self.packed = (self.packed & ~(_HEALTH_MASK << shift)) | (
+            health << shift
+        )
+
+    def _set_saw(self, active: bool) -> None:
+        if self.saw_active != active:
+            self.hash ^= _zobrist("saw")
+            self.packed ^= _SAW_BIT
+
+    def _set_handcuffs(self, active: bool) -> None:
+        if self.handcuffs_active != active:
+            self.hash ^= _zobrist("handcuffs")
+            self.packed ^= _HANDCUFFS_BIT
+
+    def _set_next_shell(self, shell: Shell | None) -> None:
+        self.hash ^= _zobrist("next", self.next_shell)
+        self.hash ^= _zobrist("next", shell)
+        self.packed = (self.packed & ~(0x3 << _NEXT_SHIFT)) | (
+            _NEXT_CODE[shell] << _NEXT_SHIFT
+        )
 
-@dataclass(order=True)
+    def _pop_shell(self, shell: Shell) -> None:
+        if shell == Shell.LIVE:
+            count = self.live_shells
+            self.packed -= 1 << _LIVE_SHIFT
+        else:
+            count = self.blank_shells
+            self.packed -= 1 << _BLANK_SHIFT
+        self.hash ^= _zobrist("shells", shell, count)
+        self.hash ^= _zobrist("shells", shell, count - 1)
+        self._set_next_shell(None)
+
+    def _shoot(self, target: Role, shell: Shell) -> None:
+        self._pop_shell(shell)
+        if shell == Shell.BLANK and target == self.current_player:
+            self._set_saw(False)
+            return
+        damage = 1 if shell == Shell.LIVE else 0
+        if self.saw_active:
+            damage *= 2
+        self._set_health(target, max(0, self.health(target) - damage))
+        self._end_turn()
+
+    def _end_turn(self) -> None:
+        if not self.handcuffs_active:
+            self.packed ^= _DEALER_BIT
+            self.hash ^= _zobrist("player", Role.PLAYER)
+            self.hash ^= _zobrist("player", Role.DEALER)
+        self._set_saw(False)
+        self._set_handcuffs(False)
+
+    def _use(self, item: Item, shell: Shell | None) -> None:
+        me = self.current_player
+        count = self.item_count(me, item)
+        self.hash ^= _zobrist("items", me, item, count)
+        self.hash ^= _zobrist("items", me, item, count - 1)
+        self.packed -= 1 << _item_shift(me, item)
+        match item:
+            case Item.BEER:
+                if shell is None:
+                    raise ValueError("beer requires a resolved shell")
+                self._pop_shell(shell)
+            case Item.GLASS:
+                self._set_next_shell(shell)
+            case Item.CIGARETTES:
+                self._set_health(
+                    me, min(self.max_health, self.health(me) + 1)
+                )
+            case Item.SAW:
+                self._set_saw(True)
+            case Item.HANDCUFFS:
+                self._set_handcuffs(True)
+
+
+@dataclass(frozen=True, slots=True)
 class MoveOption:
     p_win: float
     move: Action | None = field(compare=False)
 
 
-def p_win_sample(player, dealer, player_next, trials=1000):
-    # TODO: There should be a closed form for this
-    def move(p1, p2, p1_next):
-        if random.choice([True, False]):
-            if p1_next:
-                return p1, p2 - 1, not p1_next
-            else:
-                return p1 - 1, p2, not p1_next
-        return p1, p2, not p1_next
+@cache
+def p_win_estimate(player: int, dealer: int, player_next: bool) -> float:
+    """Exact win probability for the health-only endgame walk.
 
-    def is_win(p1, p2, _):
-        return p1 != 0 and p2 == 0
+    Models play with no shell information: each step the shell is live
+    with probability one half, a live shell always hits the shooter's
+    opponent, and the turn alternates. The two turn parities at the same
+    health pair form a small linear system; solving it gives the value
+    the old 1000-trial Monte Carlo sampler only estimated, at the cost
+    of one cached recursion over the (health, health) grid.
+    """
+    if player == 0:
+        return 0.0
+    if dealer == 0:
+        return 1.0
+    hit_dealer = p_win_estimate(player, dealer - 1, False)
+    hit_player = p_win_estimate(player - 1, dealer, True)
+    if player_next:
+        return (2 * hit_dealer + hit_player) / 3
+    return (hit_dealer + 2 * hit_player) / 3
 
-    def is_loss(p1, p2, _):
-        return p1 == 0 and p2 != 0
 
-    wins = 0
+_EXACT, _LOWER, _UPPER = range(3)
 
-    max_iter = 100
+# Shared by every MinMaxAgent in the process, so sequential games reuse
+# positions searched earlier. The cap keeps long tournaments from
+# growing it without bound; when it fills, it is simply dropped and
+# rebuilt, which is cheaper than tracking recency per probe.
+_TABLE_LIMIT = 1 << 20
 
-    for _ in range(trials):
-        state = (player, dealer, player_next)
-        for _ in range(max_iter):
-            state = move(*state)
-            if is_win(*state):
-                wins += 1
-                break
-            if is_loss(*state):
-                break
-    return wins / trials
+_table: dict[int, tuple[float, int, MoveOption]] = {}
+
+# The move that last caused a cutoff at each ply; trying it first tends
+# to repeat the cutoff in sibling subtrees.
+_killers: dict[int, Action] = {}
+
+# Depth cap for iterative deepening when no explicit limit is given; a
+# round never lasts anywhere near this many plies.
+_MAX_ITERATIVE_DEPTH = 64
+
+
+def clear_search_tables() -> None:
+    """Forget everything the search has learned so far.
+
+    Lets tournaments and benchmarks start successive runs cold without
+    restarting the process.
+    """
+    _table.clear()
+    _killers.clear()
 
 
-@cache
 def pick_move(state: MinMaxState) -> MoveOption:
-    # logger.debug(f"pick_move() called with state: {state}")
-    visible_state = state.visible_state
-    hidden_state = state.hidden_state
-    if visible_state.player_state.health == 0:
-        #    logger.debug("Player has lost, no moves to make")
+    return _search(state.to_mutable(), 0.0, 1.0, 0, math.inf)
+
+
+def pick_move_iterative(
+    state: MinMaxState,
+    max_depth: int | None = None,
+    time_budget: float | None = None,
+) -> MoveOption:
+    """Search with iterative deepening for anytime behaviour.
+
+    Each completed depth seeds the transposition table with best moves,
+    so the next, deeper iteration searches them first and prunes harder;
+    the total cost is usually below that of one cold full-depth search.
+    The move from the last iteration that finished inside the time
+    budget is returned.
+    """
+    search_state = state.to_mutable()
+    if max_depth is None:
+        max_depth = _MAX_ITERATIVE_DEPTH
+    elif max_depth < 1:
+        raise ValueError("max_depth must be at least 1")
+    deadline = None if time_budget is None else time.monotonic() + time_budget
+    # The depth-1 iteration always runs, so there is always a move to
+    # return even if the deadline has already passed.
+    best_move = _search(search_state, 0.0, 1.0, 0, 1)
+    for depth in range(2, max_depth + 1):
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+        best_move = _search(search_state, 0.0, 1.0, 0, depth)
+    return best_move
+
+
+def _search(
+    state: SearchState,
+    alpha: float,
+    beta: float,
+    ply: int = 0,
+    depth: float = math.inf,
+) -> MoveOption:
+    if state.health(Role.PLAYER) == 0:
         return MoveOption(0.0, None)
-    if visible_state.dealer_state.health == 0:
-        #   logger.debug("Player has won, no moves to make")
+    if state.health(Role.DEALER) == 0:
         return MoveOption(1.0, None)
 
-    if hidden_state.blank_shells == 0 and hidden_state.live_shells == 0:
-        # logger.debug("No shells left estimating p_win")
-        player_health = visible_state.player_state.health
-        dealer_health = visible_state.player_state.health
-        player_next = visible_state.current_player == Role.PLAYER
-        p_win = p_win_sample(player_health, dealer_health, player_next, 1000)
-        return MoveOption(
-            p_win, None
+    if state.live_shells == 0 and state.blank_shells == 0:
+        player_next = state.current_player == Role.PLAYER
+        p_win = p_win_estimate(
+            state.health(Role.PLAYER),
+            state.health(Role.DEALER),
+            player_next,
         )
-
-    options = list_moves(state)
-    # logger.debug("options are %s", options)
-    options = [score_move(state, move) for move in options]
-
-    # logger.debug("Scored options are %s", options)
+        return MoveOption(p_win, None)
+
+    if depth <= 0:
+        # Out of lookahead: fall back to the same health-only estimate
+        # used when the gun is empty.
+        player_next = state.current_player == Role.PLAYER
+        p_win = p_win_estimate(
+            state.health(Role.PLAYER),
+            state.health(Role.DEALER),
+            player_next,
+        )
+        return MoveOption(p_win, None)
+
+    tt_move = None
+    entry = _table.get(state.hash)
+    if entry is not None:
+        entry_depth, flag, cached = entry
+        if entry_depth >= depth and (
+            flag == _EXACT
+            or (flag == _LOWER and cached.p_win >= beta)
+            or (flag == _UPPER and cached.p_win <= alpha)
+        ):
+            return cached
+        tt_move = cached.move
+
+    moves = _list_moves(state)
+    if len(moves) > 1:
+        _order_moves(state, moves, tt_move, _killers.get(ply))
+
+    original_alpha = alpha
+    original_beta = beta
     best_move = None
-    if visible_state.current_player == Role.PLAYER:
-        #   logger.debug("Maximizing Player win probabity")
-        best_move = max(options)
+    if state.current_player == Role.PLAYER:
+        for move in moves:
+            value = _expected_value(state, move, alpha, beta, ply, depth)
+            if best_move is None or value > best_move.p_win:
+                best_move = MoveOption(value, move)
+            alpha = max(alpha, value)
+            if value >= beta:
+                _killers[ply] = move
+                break
     else:
-        #  logger.debug("Minimizing Player win probabilty")
-        best_move = min(options)
+        for move in moves:
+            value = _expected_value(state, move, alpha, beta, ply, depth)
+            if best_move is None or value < best_move.p_win:
+                best_move = MoveOption(value, move)
+            beta = min(beta, value)
+            if value <= alpha:
+                _killers[ply] = move
+                break
+    # _list_moves always offers at least the two shooting targets, so
+    # the loop above ran at least once.
+    assert best_move is not None
+    if best_move.p_win <= original_alpha:
+        flag = _UPPER
+    elif best_move.p_win >= original_beta:
+        flag = _LOWER
+    else:
+        flag = _EXACT
+    if entry is None or entry[0] <= depth:
+        # Replace-by-depth: a deeper result is worth more than what is
+        # already stored.
+        if entry is None and len(_table) >= _TABLE_LIMIT:
+            _table.clear()
+        _table[state.hash] = (depth, flag, best_move)
     return best_move
 
 
-def list_moves(state: MinMaxState) -> list[Action]:
-    current_player = state.visible_state.current_player
-    player_state = state.visible_state[current_player]
-    max_health = state.visible_state.max_health
-    if Item.CIGARETTES in player_state and player_state.health < max_health:
-        return [Use(Item.CIGARETTES)]
-
-    moves: list[Action] = [Shoot(target) for target in list(Role)]
-    if Item.BEER in player_state:
-        moves.append(Use(Item.BEER))
-    if Item.GLASS in player_state and state.hidden_state.next_shell is None:
-        moves.append(Use(Item.GLASS))
-    if (
-        Item.HANDCUFFS in player_state
-        and not state.visible_state.handcuffs_active
-    ):
-        moves.append(Use(Item.HANDCUFFS))
-    if Item.SAW in player_state and not state.visible_state.saw_active:
-        moves.append(Use(Item.SAW))
-    return moves
+def _order_moves(
+    state: SearchState,
+    moves: list[Action],
+    tt_move: Action | None,
+    killer: Action | None,
+) -> None:
+    """Sort moves so that likely-best ones are searched first.
 
+    Good ordering is what lets alpha-beta approach its best-case node
+    count: a strong first move raises the bound and cuts the rest. The
+    transposition table's best move and the killer move for this ply are
+    tried before the static heuristic.
+    """
 
-def score_move(state: MinMaxState, move: Action) -> MoveOption:
-    states = state.perform_action(move)
-    p_win = sum(s.p_state * pick_move(s.state).p_win for s in states)
-    return MoveOption(p_win, move)
+    def score(move: Action) -> int:
+        if move == tt_move:
+            return 100
+        if move == killer:
+            return 50
+        return _move_score(state, move)
+
+    moves.sort(key=score, reverse=True)
+
+
+def _move_score(state: SearchState, move: Action) -> int:
+    """Score a move statically from the moving player's perspective."""
+    me = state.current_player
+    if state.next_shell is not None:
+        p_live = 1.0 if state.next_shell == Shell.LIVE else 0.0
+    else:
+        p_live = state.live_shells / (
+            state.live_shells + state.blank_shells
+        )
+    match move:
+        case Shoot(target) if target != me:
+            return 5 if p_live > 0.5 else 1
+        case Shoot(_):
+            # Shooting yourself is only attractive when a blank is
+            # likely (it keeps the turn).
+            return 4 if p_live < 0.5 else 0
+        case Use(Item.GLASS) | Use(Item.BEER):
+            return 3
+        case Use(Item.SAW):
+            if p_live > 0.5 and state.health(me.opponent) <= 2:
+                return 4
+            return 2
+        case _:
+            return 2
+
+
+def _expected_value(
+    state: SearchState,
+    move: Action,
+    alpha: float,
+    beta: float,
+    ply: int = 0,
+    depth: float = math.inf,
+) -> float:
+    if not _is_chance_move(move):
+        token = state.apply(move)
+        value = _search(state, alpha, beta, ply + 1, depth - 1).p_win
+        state.undo(token)
+        return value
+
+    # A chance node: the expectation over the possible shells, with
+    # star1-style pruning. Each outcome's window is derived from how much
+    # the still-unsearched outcomes could swing the total (values are
+    # probabilities, so each child lies in [0, 1]), and the node fails
+    # low or high as soon as the running bounds leave (alpha, beta).
+    outcomes = state.shell_outcomes()
+    outcomes.sort(key=lambda outcome: outcome[0], reverse=True)
+    value = 0.0
+    remaining = 1.0
+    for p_shell, shell in outcomes:
+        remaining -= p_shell
+        child_alpha = max(0.0, (alpha - value - remaining) / p_shell)
+        child_beta = min(1.0, (beta - value) / p_shell)
+        token = state.apply(move, shell)
+        child = _search(
+            state, child_alpha, child_beta, ply + 1, depth - 1
+        ).p_win
+        state.undo(token)
+        value += p_shell * child
+        if value + remaining <= alpha:
+            return value + remaining
+        if value >= beta:
+            return value
+    return value
+
+
+def _is_chance_move(move: Action) -> bool:
+    match move:
+        case Shoot(_):
+            return True
+        case Use(Item.BEER) | Use(Item.GLASS):
+            return True
+        case _:
+            return False
+
+
+# Legal-move lists depend on only a few booleans, so positions that
+# differ in shells or opponent inventory share one cached tuple.
+_move_lists: dict[tuple, tuple[Action, ...]] = {}
+
+
+def _list_moves(state: SearchState) -> list[Action]:
+    me = state.current_player
+    key = (
+        me,
+        state.item_count(me, Item.CIGARETTES) > 0
+        and state.health(me) < state.max_health,
+        state.item_count(me, Item.BEER) > 0,
+        state.item_count(me, Item.GLASS) > 0 and state.next_shell is None,
+        state.item_count(me, Item.HANDCUFFS) > 0
+        and not state.handcuffs_active,
+        state.item_count(me, Item.SAW) > 0 and not state.saw_active,
+    )
+    cached = _move_lists.get(key)
+    if cached is None:
+        me, smoke, beer, glass, handcuffs, saw = key
+        if smoke:
+            cached = (_USE[Item.CIGARETTES],)
+        else:
+            moves: list[Action] = [_SHOOT[target] for target in _ROLES]
+            if beer:
+                moves.append(_USE[Item.BEER])
+            if glass:
+                moves.append(_USE[Item.GLASS])
+            if handcuffs:
+                moves.append(_USE[Item.HANDCUFFS])
+            if saw:
+                moves.append(_USE[Item.SAW])
+            cached = tuple(moves)
+        _move_lists[key] = cached
+    # Callers reorder the list in place, so hand out a fresh copy.
+    return list(cached)
 
 
 class MinMaxAgent(Agent):
-    def __init__(self, role: Role):
+    def __init__(
+        self,
+        role: Role,
+        max_depth: int | None = None,
+        time_budget: float | None = None,
+    ):
         super().__init__(role)
         self._last_move = None
+        self._max_depth = max_depth
+        self._time_budget = time_budget
         self.reset_shells(0, 0)
 
     def reset_shells(self, live: int, blank: int) -> None:
@@ -300,14 +842,19 @@ class MinMaxAgent(Agent):
         my_state = state[self.role]
         if my_state.health < state.max_health and Item.CIGARETTES in my_state:
             logger.debug("Health is below max, using cigarettes")
-            return Use(Item.CIGARETTES)
+            return _USE[Item.CIGARETTES]
 
         known_state = MinMaxState(
             visible_state=state, hidden_state=self._hidden_state
         )
 
         logger.debug("Known state is %s", known_state)
-        best_move = pick_move(known_state).move
+        if self._max_depth is None and self._time_budget is None:
+            best_move = pick_move(known_state).move
+        else:
+            best_move = pick_move_iterative(
+                known_state, self._max_depth, self._time_budget
+            ).move
 
         logger.debug("Decided that the best move is %s", best_move)
         if best_move is None:
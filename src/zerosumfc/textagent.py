@@ -1,6 +1,15 @@
 """A text based Buckshot Roulette agent."""
 
+import re
 from dataclasses import dataclass
+from functools import lru_cache
+
+try:
+    # Importing readline upgrades input() with line editing and
+    # history, so "SHOOT DEALER" can be reissued with one keystroke.
+    import readline  # noqa: F401
+except ImportError:  # pragma: no cover - not available on Windows
+    pass
 
 from zerosumfc.agents import Agent
 from zerosumfc.data import (
@@ -23,10 +32,17 @@ from zerosumfc.data import (
 class TextAgent(Agent):
     """Prints game info to a stream and queries the user for their move."""
 
+    # Parsers hold no per-game state, so the two possible roles share
+    # one instance each.
+    _PARSERS: dict[Role, "ActionParser"] = {}
+
     def __init__(self, role: Role):
         """Initialise the agent for the given role."""
         super().__init__(role)
-        self._parser = ActionParser(role)
+        parser = self._PARSERS.get(role)
+        if parser is None:
+            parser = self._PARSERS.setdefault(role, ActionParser(role))
+        self._parser = parser
 
     def reset_shells(self, live: int, blank: int):
         """Print out the number of shells that have been loaded."""
@@ -58,6 +74,10 @@ def render_reload(live: int, blank: int):
     )
 
 
+# The render functions are pure and their inputs are hashable frozen
+# values drawn from small domains, so repeated renders (every turn for
+# the GPT agent) are served from the cache.
+@lru_cache(maxsize=4096)
 def render_feedback(me: Role, feedback: Feedback | None) -> str:
     match feedback:
         case Hit(target):
@@ -77,6 +97,7 @@ def render_feedback(me: Role, feedback: Feedback | None) -> str:
             return "You can't do that."
 
 
+@lru_cache(maxsize=4096)
 def render_opponent_move(
     me: Role, action: Action, result: Feedback | None
 ) -> str:
@@ -102,36 +123,47 @@ def render_opponent_move(
     return output
 
 
+@lru_cache(maxsize=4096)
 def render_state(me: Role, state: GameState) -> str:
     def render_items(state: PlayerState) -> str:
         if state.total_items == 0:
             return "Nothing."
-        else:
-            lines = [
-                f"{item.name} ({count})"
-                for item, count in state.items()
-                if count > 0
-            ]
-            return "\n".join(lines)
+        return "\n".join(
+            f"{item.name} ({count})"
+            for item, count in state.items()
+            if count > 0
+        )
 
     personal_state = state[me]
     opponent_state = state[me.opponent]
-    output = [f"Your health: {personal_state.health}"]
-    output.append(f"Opponent's health: {opponent_state.health}")
-    output.append("Your items:")
-    output.append(render_items(personal_state))
-    output.append("Your opponent's items")
-    output.append(render_items(opponent_state))
-    return "\n".join(output)
+    return "\n".join((
+        f"Your health: {personal_state.health}",
+        f"Opponent's health: {opponent_state.health}",
+        "Your items:",
+        render_items(personal_state),
+        "Your opponent's items",
+        render_items(opponent_state),
+    ))
+
 
+# Compiled once; a single full match replaces the prefix test, the
+# removeprefix and the strip that each parse attempt used to do.
+_USE_RE = re.compile(r"USE\s*(?P<item>.*?)\s*")
+_SHOOT_RE = re.compile(r"SHOOT\s*(?P<target>.*?)\s*")
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ParseFailure:
     """If parsing has failed this will explain the reason."""
 
     message: str
 
 
+# The catch-all failure carries no specifics, so every mis-parse can
+# share one instance.
+_UNRECOGNISED = ParseFailure("Unrecognised action.")
+
+
 class ActionParser:
     """A simple parser to recognise actions.
 
@@ -146,43 +178,53 @@ class ActionParser:
         handle relative naming.
         """
         self._me = me
+        # Token tables built once so a parse is a dict probe with no
+        # enum metaclass lookup and no KeyError on bad input.
+        self._items = {item.name: Use(item) for item in Item}
+        self._targets = {
+            "DEALER": Shoot(Role.DEALER),
+            "PLAYER": Shoot(Role.PLAYER),
+            "ME": Shoot(me),
+            "MYSELF": Shoot(me),
+            "SELF": Shoot(me),
+            "OPPONENT": Shoot(me.opponent),
+            "OTHER": Shoot(me.opponent),
+        }
+        self._verbs = {
+            "USE": self._parse_item_body,
+            "SHOOT": self._parse_shoot_body,
+        }
 
     def __call__(self, input: str) -> Action | ParseFailure:
         """Attempt to parse the input using any of the availabel rules."""
-        input = input.strip().upper()
-        action = self.parse_item(input)
-        if action is not None:
-            return action
-        action = self.parse_shoot(input)
-        if action is not None:
-            return action
-
-        return ParseFailure("Unrecognised action.")
+        verb, _, rest = input.strip().upper().partition(" ")
+        handler = self._verbs.get(verb)
+        if handler is None:
+            return _UNRECOGNISED
+        return handler(rest.strip())
 
     def parse_item(self, text: str) -> Use | ParseFailure | None:
         """Attempt to parse the line as a USE action."""
-        prefix = "USE"
-        if not text.startswith(prefix):
+        parsed = _USE_RE.fullmatch(text)
+        if parsed is None:
             return None
-        item = text.removeprefix(prefix).strip()
-        try:
-            return Use(Item[item])
-        except KeyError:
+        return self._parse_item_body(parsed["item"])
+
+    def _parse_item_body(self, item: str) -> Use | ParseFailure:
+        action = self._items.get(item)
+        if action is None:
             return ParseFailure(f"Unknown item '{item}'")
+        return action
 
     def parse_shoot(self, text: str) -> Shoot | ParseFailure | None:
         """Attempt to parse the line as a SHOOT action."""
-        prefix = "SHOOT"
-        if not text.startswith(prefix):
+        parsed = _SHOOT_RE.fullmatch(text)
+        if parsed is None:
             return None
-        match text.removeprefix(prefix).strip():
-            case "DEALER":
-                return Shoot(Role.DEALER)
-            case "PLAYER":
-                return Shoot(Role.PLAYER)
-            case "ME" | "MYSELF" | "SELF":
-                return Shoot(self._me)
-            case "OPPONENT" | "OTHER":
-                return Shoot(self._me.opponent)
-            case target:
-                return ParseFailure(f"Unknown target '{target}'")
+        return self._parse_shoot_body(parsed["target"])
+
+    def _parse_shoot_body(self, target: str) -> Shoot | ParseFailure:
+        action = self._targets.get(target)
+        if action is None:
+            return ParseFailure(f"Unknown target '{target}'")
+        return action
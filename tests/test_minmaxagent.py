@@ -1,11 +1,21 @@
 import pytest
 
 from zerosumfc.buckshotroulette import FullGameState, Game
-from zerosumfc.data import GameState, Item, Role, PlayerState, Shell, Shoot
+from zerosumfc.data import (
+    GameState,
+    Item,
+    Role,
+    PlayerState,
+    Shell,
+    Shoot,
+    Use,
+)
 from zerosumfc.minmaxagent import (
+    clear_search_tables,
     HiddenState,
     MinMaxAgent,
     MinMaxState,
+    SearchState,
     pick_move,
     StateProb,
 )
@@ -171,6 +181,123 @@ def test_min_max_state_use_unavilable_item_error(item: Item):
         new_states = state.use_item(item)
 
 
+def full_inventory_state(live_shells: int, blank_shells: int) -> MinMaxState:
+    loadout = PlayerState(
+        health=3,
+        glass_count=1,
+        beer_count=1,
+        saw_count=1,
+        handcuffs_count=1,
+        cigarettes_count=1,
+    )
+    return MinMaxState(
+        visible_state=GameState(
+            player_state=loadout,
+            dealer_state=loadout,
+            max_health=4,
+        ),
+        hidden_state=HiddenState(
+            live_shells=live_shells, blank_shells=blank_shells
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "move",
+    [
+        Shoot(Role.PLAYER),
+        Shoot(Role.DEALER),
+        Use(Item.GLASS),
+        Use(Item.BEER),
+        Use(Item.CIGARETTES),
+        Use(Item.SAW),
+        Use(Item.HANDCUFFS),
+    ],
+)
+def test_search_state_matches_perform_action(move):
+    state = full_inventory_state(live_shells=2, blank_shells=2)
+    search = state.to_mutable()
+
+    expected = state.perform_action(move)
+    if len(expected) == 1 and expected[0].p_state == 1.0:
+        shells = [(1.0, None)]
+    else:
+        shells = search.shell_outcomes()
+
+    actual = []
+    for p_shell, shell in shells:
+        token = search.apply(move, shell)
+        actual.append(StateProb(p_shell, search.to_minmax()))
+        search.undo(token)
+
+    assert actual == expected
+    assert search.to_minmax() == state
+
+
+def test_search_state_apply_undo_roundtrip():
+    state = full_inventory_state(live_shells=2, blank_shells=2)
+    search = state.to_mutable()
+    initial = (search.hash, search.packed)
+
+    moves = [
+        (Use(Item.GLASS), Shell.LIVE),
+        (Shoot(Role.DEALER), Shell.LIVE),
+        (Use(Item.HANDCUFFS), None),
+        (Shoot(Role.PLAYER), Shell.BLANK),
+        (Use(Item.SAW), None),
+        (Shoot(Role.PLAYER), Shell.LIVE),
+    ]
+    tokens = []
+    for move, shell in moves:
+        tokens.append(search.apply(move, shell))
+        # The incrementally maintained hash must agree with the hash of
+        # a state packed from scratch.
+        repacked = SearchState.from_minmax(search.to_minmax())
+        assert search.hash == repacked.hash
+        assert search.packed == repacked.packed
+
+    for token in reversed(tokens):
+        search.undo(token)
+    assert (search.hash, search.packed) == initial
+    assert search.to_minmax() == state
+
+
+@pytest.fixture
+def clean_search_tables():
+    # The search tables are shared process-wide; clearing them on both
+    # sides keeps this test and its neighbours order-independent.
+    clear_search_tables()
+    yield
+    clear_search_tables()
+
+
+def test_pick_move_values_glass(clean_search_tables):
+    # At one health each with one live and one blank, shooting blind
+    # wins half the time, but the glass makes the win certain: a live
+    # reveal means shoot the dealer, a blank reveal means shoot
+    # yourself to keep the turn and then shoot the dealer.
+    state = MinMaxState(
+        visible_state=GameState(
+            player_state=PlayerState(health=1, glass_count=1),
+            dealer_state=PlayerState(health=1),
+            max_health=1,
+        ),
+        hidden_state=HiddenState(live_shells=1, blank_shells=1),
+    )
+    best = pick_move(state)
+    assert best.move == Use(Item.GLASS)
+    assert best.p_win == 1.0
+
+
+def test_search_state_rejects_unpackable_health():
+    state = MinMaxState(
+        visible_state=GameState.new(64),
+        hidden_state=HiddenState(live_shells=1, blank_shells=1),
+    )
+    with pytest.raises(ValueError):
+        state.to_mutable()
+
+
 @pytest.mark.parametrize(
     "player, expected_score", [(Role.PLAYER, 0.0), (Role.DEALER, 1.0)]
 )
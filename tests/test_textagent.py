@@ -1,41 +1,54 @@
+import pytest
+
 from zerosumfc.data import Item, Role, Shoot, Use
 from zerosumfc.textagent import ActionParser, ParseFailure
 
 
-def test_parse_item():
-    parser = ActionParser(Role.DEALER)
-    for item in Item:
-        assert parser.parse_item(f"USE {item.name}") == Use(item)
+@pytest.fixture(scope="module")
+def dealer_parser():
+    return ActionParser(Role.DEALER)
+
+
+@pytest.mark.parametrize("item", list(Item))
+def test_parse_item(dealer_parser, item):
+    assert dealer_parser.parse_item(f"USE {item.name}") == Use(item)
+
+
+def test_parse_item_failures(dealer_parser):
+    assert dealer_parser.parse_item("TIE SHOE") is None
+
+    assert type(dealer_parser.parse_item("USE notanitem")) is ParseFailure
+    assert type(dealer_parser.parse_item("USE")) is ParseFailure
+
 
-    assert parser.parse_item("TIE SHOE") is None
+@pytest.mark.parametrize("role", list(Role))
+def test_parse_shoot_nonrelative(dealer_parser, role):
+    assert dealer_parser.parse_shoot(f"SHOOT {role.name}") == Shoot(role)
 
-    assert type(parser.parse_item("USE notanitem")) is ParseFailure
-    assert type(parser.parse_item("USE")) is ParseFailure
 
+def test_parse_shoot_failures(dealer_parser):
+    assert dealer_parser.parse_shoot("TIE SHOE") is None
 
-def test_parse_shoot_nonrelative():
-    parser = ActionParser(Role.DEALER)
-    for role in Role:
-        assert parser.parse_shoot(f"SHOOT {role.name}") == Shoot(role)
+    assert type(dealer_parser.parse_shoot("SHOOT GUN")) is ParseFailure
+    assert type(dealer_parser.parse_shoot("SHOOT")) is ParseFailure
 
-    assert parser.parse_shoot("TIE SHOE") is None
 
-    assert type(parser.parse_shoot("SHOOT GUN")) is ParseFailure
-    assert type(parser.parse_shoot("SHOOT")) is ParseFailure
+@pytest.mark.parametrize("role", list(Role))
+@pytest.mark.parametrize("word", ["ME", "MYSELF", "SELF"])
+def test_parse_shoot_relative_self(role, word):
+    parser = ActionParser(role)
+    assert parser.parse_shoot(f"SHOOT {word}") == Shoot(role)
 
 
-def test_parse_shoot_relaive():
-    for role in list(Role):
-        parser = ActionParser(role)
-        for word in ["ME", "MYSELF", "SELF"]:
-            assert parser.parse_shoot(f"SHOOT {word}") == Shoot(role)
-        for word in ["OPPONENT", "OTHER"]:
-            assert parser.parse_shoot(f"SHOOT {word}") == Shoot(role.opponent)
+@pytest.mark.parametrize("role", list(Role))
+@pytest.mark.parametrize("word", ["OPPONENT", "OTHER"])
+def test_parse_shoot_relative_opponent(role, word):
+    parser = ActionParser(role)
+    assert parser.parse_shoot(f"SHOOT {word}") == Shoot(role.opponent)
 
 
-def test_parse_action():
-    parser = ActionParser(Role.DEALER)
-    assert parser("SHOOT DEALER") == Shoot(Role.DEALER)
-    assert parser("USE GLASS") == Use(Item.GLASS)
-    assert type(parser("TIE SHOE")) is ParseFailure
-    assert type(parser("USE GLASS AGAIN")) is ParseFailure
+def test_parse_action(dealer_parser):
+    assert dealer_parser("SHOOT DEALER") == Shoot(Role.DEALER)
+    assert dealer_parser("USE GLASS") == Use(Item.GLASS)
+    assert type(dealer_parser("TIE SHOE")) is ParseFailure
+    assert type(dealer_parser("USE GLASS AGAIN")) is ParseFailure